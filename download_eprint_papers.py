@@ -3,6 +3,8 @@
 
 从paper_eprint_urls.json读取论文信息和eprint链接，
 然后下载论文并以"[作者]-[标题].pdf"的格式保存。
+使用--refresh参数时，通过ETag/Last-Modified条件请求重新验证已下载的论文，
+只重新下载有更新的版本。
 """
 
 # 确保使用UTF-8编码，避免中文显示乱码
@@ -18,12 +20,14 @@ import os
 import time
 import re
 import requests
+from email.utils import formatdate
 from urllib.parse import urlparse, urljoin
 from tqdm import tqdm
 
 # 配置
 DOWNLOAD_FOLDER = "papers"  # 论文保存的文件夹
 INPUT_FILE = "paper_eprint_urls.json"  # 包含eprint链接的输入文件
+METADATA_FILE = "paper_download_metadata.json"  # 保存每篇论文PDF的ETag/Last-Modified
 MAX_RETRIES = 3  # 下载失败时的最大重试次数
 DELAY_BETWEEN_DOWNLOADS = 2  # 两次下载之间的延迟（秒）
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -61,7 +65,55 @@ def extract_pdf_url_from_eprint_url(eprint_url):
     return f"{base_url}.pdf"
 
 
-def download_file(url, output_path, max_retries=3):
+def load_metadata():
+    """
+    读取已下载论文的版本元数据（ETag/Last-Modified）
+    """
+    if not os.path.exists(METADATA_FILE):
+        return {}
+    try:
+        with open(METADATA_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"读取下载元数据出错: {str(e)}")
+        return {}
+
+
+def save_metadata(metadata):
+    """
+    保存已下载论文的版本元数据
+    """
+    try:
+        with open(METADATA_FILE, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"保存下载元数据出错: {str(e)}")
+
+
+def build_conditional_headers(url, output_path, validators):
+    """
+    根据已保存的版本元数据构建条件请求头
+    
+    如果没有保存过ETag/Last-Modified（例如旧版本下载的文件），
+    则使用本地文件的修改时间作为If-Modified-Since。
+    """
+    headers = {}
+    if not os.path.exists(output_path):
+        return headers
+    
+    if validators and validators.get("pdf_url") == url:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    
+    if not headers:
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(output_path), usegmt=True)
+    
+    return headers
+
+
+def download_file(url, output_path, max_retries=3, session=None, validators=None, refresh=False):
     """
     下载文件并显示进度条
     
@@ -69,14 +121,24 @@ def download_file(url, output_path, max_retries=3):
         url: 要下载的文件URL
         output_path: 保存文件的路径
         max_retries: 最大重试次数
+        session: 共享的requests.Session（连接池），默认为None（使用requests模块）
+        validators: 该文件的版本元数据字典，下载成功后会就地更新
+        refresh: 是否对已存在的文件发起条件请求，仅在版本变化时重新下载
     
     Returns:
-        bool: 下载成功返回True，否则返回False
+        下载成功返回"downloaded"，文件未更新（304）返回"not_modified"，否则返回False
     """
+    if session is None:
+        session = requests
+    if validators is None:
+        validators = {}
+    
     headers = {
         "User-Agent": USER_AGENT,
         "Accept": "application/pdf,application/octet-stream",
     }
+    if refresh:
+        headers.update(build_conditional_headers(url, output_path, validators))
     
     # 创建临时文件路径
     temp_path = f"{output_path}.download"
@@ -84,7 +146,21 @@ def download_file(url, output_path, max_retries=3):
     for attempt in range(max_retries):
         try:
             # 发起请求
-            response = requests.get(url, headers=headers, stream=True, timeout=30)
+            response = session.get(url, headers=headers, stream=True, timeout=30)
+            
+            # 304表示服务器上的版本没有变化，保留本地文件
+            if response.status_code == 304:
+                response.close()
+                print(f"论文未更新: {os.path.basename(output_path)}")
+                validators["pdf_url"] = url
+                # 304也可能带有更新后的ETag/Last-Modified
+                if response.headers.get("ETag"):
+                    validators["etag"] = response.headers.get("ETag")
+                if response.headers.get("Last-Modified"):
+                    validators["last_modified"] = response.headers.get("Last-Modified")
+                validators["checked"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                return "not_modified"
+            
             response.raise_for_status()
             
             # 获取文件大小
@@ -124,7 +200,14 @@ def download_file(url, output_path, max_retries=3):
                 if os.path.exists(output_path):
                     os.remove(output_path)  # 如果存在同名文件，先删除
                 os.rename(temp_path, output_path)
-                return True
+                
+                # 记录版本元数据，供下次--refresh时条件请求使用
+                validators["pdf_url"] = url
+                validators["etag"] = response.headers.get("ETag")
+                validators["last_modified"] = response.headers.get("Last-Modified")
+                validators["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                validators["checked"] = validators["timestamp"]
+                return "downloaded"
             
         except requests.exceptions.RequestException as e:
             if os.path.exists(temp_path):
@@ -157,9 +240,12 @@ def get_first_author(authors_str):
     return last_name
 
 
-def download_papers():
+def download_papers(refresh=False):
     """
     批量下载论文
+    
+    Args:
+        refresh: 是否重新验证已下载的论文，只重新下载版本有变化的论文，默认为False
     """
     # 创建下载文件夹
     if not os.path.exists(DOWNLOAD_FOLDER):
@@ -191,48 +277,66 @@ def download_papers():
         
         print(f"找到 {len(papers_with_url)}/{len(papers_data)} 篇有eprint链接的论文")
         
+        # 读取版本元数据，并创建共享连接池的会话
+        metadata = load_metadata()
+        
         # 开始下载
         successful = 0
         failed = 0
+        updated = 0
         
-        for title, data in papers_with_url.items():
-            eprint_url = data.get("eprint_url")
-            authors = data.get("authors", "")
-            
-            # 构建文件名
-            first_author = get_first_author(authors)
-            filename = f"{first_author}-{title}.pdf"
-            safe_filename = sanitize_filename(filename)
-            output_path = os.path.join(DOWNLOAD_FOLDER, safe_filename)
-            
-            # 如果文件已存在，则跳过
-            if os.path.exists(output_path):
-                print(f"跳过已下载的论文: {safe_filename}")
-                successful += 1
-                continue
-            
-            # 获取PDF下载链接
-            pdf_url = extract_pdf_url_from_eprint_url(eprint_url)
-            
-            print(f"\n下载论文: {title}")
-            print(f"作者: {authors}")
-            print(f"eprint URL: {eprint_url}")
-            print(f"PDF URL: {pdf_url}")
-            print(f"保存为: {safe_filename}")
-            
-            # 下载PDF
-            if download_file(pdf_url, output_path, max_retries=MAX_RETRIES):
-                print(f"成功下载: {safe_filename}")
-                successful += 1
-            else:
-                print(f"下载失败: {title}")
-                failed += 1
-            
-            # 延迟，避免请求过于频繁
-            time.sleep(DELAY_BETWEEN_DOWNLOADS)
+        with requests.Session() as session:
+            for title, data in papers_with_url.items():
+                eprint_url = data.get("eprint_url")
+                authors = data.get("authors", "")
+                
+                # 构建文件名
+                first_author = get_first_author(authors)
+                filename = f"{first_author}-{title}.pdf"
+                safe_filename = sanitize_filename(filename)
+                output_path = os.path.join(DOWNLOAD_FOLDER, safe_filename)
+                
+                # 如果文件已存在，则跳过（刷新模式下改为条件请求重新验证）
+                exists = os.path.exists(output_path)
+                if exists and not refresh:
+                    print(f"跳过已下载的论文: {safe_filename}")
+                    successful += 1
+                    continue
+                
+                # 获取PDF下载链接
+                pdf_url = extract_pdf_url_from_eprint_url(eprint_url)
+                validators = dict(metadata.get(title, {}))
+                
+                print(f"\n{'检查论文更新' if exists else '下载论文'}: {title}")
+                print(f"作者: {authors}")
+                print(f"eprint URL: {eprint_url}")
+                print(f"PDF URL: {pdf_url}")
+                print(f"保存为: {safe_filename}")
+                
+                # 下载PDF
+                status = download_file(pdf_url, output_path, max_retries=MAX_RETRIES,
+                                       session=session, validators=validators, refresh=refresh)
+                if status:
+                    if status == "downloaded":
+                        print(f"成功下载: {safe_filename}")
+                        if exists:
+                            updated += 1
+                    successful += 1
+                    
+                    # 每成功处理一篇论文，立即保存元数据
+                    metadata[title] = validators
+                    save_metadata(metadata)
+                else:
+                    print(f"下载失败: {title}")
+                    failed += 1
+                
+                # 延迟，避免请求过于频繁
+                time.sleep(DELAY_BETWEEN_DOWNLOADS)
         
         # 总结
         print(f"\n下载完成! 成功: {successful}, 失败: {failed}, 总计: {len(papers_with_url)}")
+        if refresh:
+            print(f"有更新并重新下载的论文: {updated}")
         if successful > 0:
             print(f"论文已保存到文件夹: {os.path.abspath(DOWNLOAD_FOLDER)}")
         
@@ -244,8 +348,15 @@ def main():
     """
     主函数
     """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='批量下载IACR eprint论文')
+    parser.add_argument('--refresh', action='store_true', help='重新验证已下载的论文，只下载有更新的版本')
+    
+    args = parser.parse_args()
+    
     print("开始批量下载IACR eprint论文...")
-    download_papers()
+    download_papers(refresh=args.refresh)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import os
 import re
 import time
 import urllib.parse
+import difflib
 import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -214,7 +215,180 @@ def get_eprint_url(title, authors="", driver=None):
         if need_to_close_driver and driver:
             driver.quit()
 
-def process_papers_from_json(use_headless=True, start_index=0, end_index=None, retry_failed=False):
+def normalize_title(title):
+    """
+    规范化论文标题，便于比较（小写、去除标点、合并空白）
+    """
+    title = re.sub(r'[^0-9a-z]+', ' ', title.lower())
+    return title.strip()
+
+def split_authors(authors):
+    """
+    将作者字符串拆分为作者列表
+    """
+    return [a.strip() for a in authors.split(',') if a.strip()]
+
+def plan_author_queries(pending_papers):
+    """
+    按共同作者对待处理论文分组，生成查询计划
+
+    每篇论文被分配给其作者中待处理论文数最多的一位（并列时取排名靠前的作者），
+    只有包含至少两篇论文的分组才会按作者搜索，其余论文仍按标题逐篇搜索。
+
+    Args:
+        pending_papers: (索引, 论文信息) 的列表
+
+    Returns:
+        (author_groups, leftovers): author_groups为 [(作者, [(索引, 论文信息), ...]), ...]，
+        leftovers为需要按标题搜索的 (索引, 论文信息) 列表
+    """
+    # 统计每位作者在待处理论文中出现的次数
+    author_counts = {}
+    for _, paper in pending_papers:
+        for author in split_authors(paper.get("authors", "")):
+            author_counts[author] = author_counts.get(author, 0) + 1
+
+    groups = {}
+    leftovers = []
+    for i, paper in pending_papers:
+        authors = split_authors(paper.get("authors", ""))
+        if not authors:
+            leftovers.append((i, paper))
+            continue
+        best_author = max(authors, key=lambda a: author_counts[a])
+        groups.setdefault(best_author, []).append((i, paper))
+
+    author_groups = []
+    for author, members in groups.items():
+        if len(members) > 1:
+            author_groups.append((author, members))
+        else:
+            leftovers.extend(members)
+
+    # 论文多的分组优先处理，剩余论文保持原有顺序
+    author_groups.sort(key=lambda g: len(g[1]), reverse=True)
+    leftovers.sort(key=lambda p: p[0])
+    return author_groups, leftovers
+
+def get_author_eprint_urls(author, titles, driver=None):
+    """
+    在eprint上按作者搜索一次，并将结果与该作者的所有论文标题进行匹配
+
+    Args:
+        author: 作者姓名
+        titles: 该作者待查找的论文标题列表
+        driver: 共享的WebDriver实例，默认为None（自动创建）
+
+    Returns:
+        dict: 标题到eprint链接的映射，只包含匹配成功的论文
+    """
+    search_results_dir = "search_results"
+    if not os.path.exists(search_results_dir):
+        os.makedirs(search_results_dir)
+
+    search_url = f"https://eprint.iacr.org/search?authors={urllib.parse.quote(author)}"
+    print(f"按作者搜索: {author} ({len(titles)} 篇论文)")
+    print(f"eprint搜索URL: {search_url}")
+
+    safe_author = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in author)
+    html_file = os.path.join(search_results_dir, f"author_{safe_author[:50]}.html")
+
+    need_to_close_driver = False
+    try:
+        if driver is None:
+            driver = setup_webdriver()
+            need_to_close_driver = True
+        driver.get(search_url)
+
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a.paperlink, a[href^='/20']"))
+            )
+        except:
+            print("页面加载超时，尝试使用当前内容继续处理...")
+
+        rendered_html = driver.page_source
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(rendered_html)
+        print(f"作者搜索结果已保存到: {html_file}")
+
+        # 收集搜索结果：每个eprint编号对应其所在结果块的文本
+        soup = BeautifulSoup(rendered_html, 'html.parser')
+        paper_link_pattern = re.compile(r'^(?:https?://eprint\.iacr\.org)?/(\d{4}/\d{1,5})$')
+        candidates = {}
+        for link in soup.select("a[href]"):
+            match = paper_link_pattern.match(link.get('href', '').strip())
+            if not match:
+                continue
+            eprint_url = f"https://eprint.iacr.org/{match.group(1)}"
+            # 向上查找只包含这一条结果、且带有标题的最小元素
+            text = None
+            for parent in link.parents:
+                if parent.name != "div":
+                    continue
+                if len({m.group(1) for m in (paper_link_pattern.match(a.get('href', '').strip())
+                                             for a in parent.select("a[href]")) if m}) > 1:
+                    break
+                block_title = parent.select_one("strong")
+                if block_title:
+                    text = block_title.get_text(" ", strip=True)
+                    break
+            # 没有标题元素的结果无法可靠匹配，直接跳过
+            if not text:
+                continue
+            candidates.setdefault(eprint_url, normalize_title(text))
+        print(f"找到 {len(candidates)} 个作者搜索结果")
+
+        # 一次遍历，将所有标题与结果进行匹配
+        matched = {}
+        for title in titles:
+            target = normalize_title(title)
+            if not target:
+                continue
+            
+            # 优先使用完全相同的标题，否则取相似度最高的结果
+            best_urls = [url for url, text in candidates.items() if text == target]
+            if not best_urls:
+                best_ratio = 0.0
+                for eprint_url, text in candidates.items():
+                    ratio = difflib.SequenceMatcher(None, target, text).ratio()
+                    if ratio > best_ratio:
+                        best_urls, best_ratio = [eprint_url], ratio
+                    elif ratio == best_ratio and best_urls:
+                        best_urls.append(eprint_url)
+                if best_ratio < 0.9:
+                    best_urls = []
+            
+            if len(best_urls) == 1:
+                print(f"匹配成功: {title} -> {best_urls[0]}")
+                matched[title] = best_urls[0]
+            elif best_urls:
+                # 多个结果同样匹配时不做猜测，留待按标题搜索
+                print(f"作者搜索中有多个同等匹配的结果，改为按标题搜索: {title}")
+            else:
+                print(f"作者搜索中未匹配: {title}")
+        return matched
+
+    except Exception as e:
+        print(f"按作者搜索出错 ({author}): {str(e)}")
+        return {}
+
+    finally:
+        if need_to_close_driver and driver:
+            driver.quit()
+
+def save_results(result_dict, output_file):
+    """
+    将结果保存到JSON文件
+    """
+    try:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"保存结果时出错: {str(e)}")
+
+def process_papers_from_json(use_headless=True, start_index=0, end_index=None, retry_failed=False,
+                             batch_by_author=True):
     """
     处理论文JSON文件，提取eprint链接
     
@@ -223,6 +397,7 @@ def process_papers_from_json(use_headless=True, start_index=0, end_index=None, r
         start_index: 开始处理的论文索引，默认从0开始
         end_index: 结束处理的论文索引（不包含），默认处理到最后
         retry_failed: 是否重试之前失败的论文，默认为False
+        batch_by_author: 是否先按共同作者批量搜索，默认为True
     """
     # 读取论文JSON文件
     json_file = "eurocrypt_2025_papers.json"
@@ -256,23 +431,64 @@ def process_papers_from_json(use_headless=True, start_index=0, end_index=None, r
             end_index = total_papers
             
         # 输出处理范围
-        print(f"将处理论文 {start_index+1} 到 {end_index} (共 {end_index-start_index} 篇)")        # 处理每篇论文
+        print(f"将处理论文 {start_index+1} 到 {end_index} (共 {end_index-start_index} 篇)")
+        
+        # 筛选出需要处理的论文
+        pending_papers = []
         for i, paper in enumerate(papers[start_index:end_index], start=start_index):
             title = paper.get("title")
-            authors = paper.get("authors", "")
             
             # 检查是否需要跳过已处理的论文
-            skip_paper = False
             if not retry_failed and title in result_dict:
                 if "eprint_url" in result_dict[title] and result_dict[title]["eprint_url"]:
                     print(f"跳过已处理的论文 ({i+1}/{total_papers}): {title}")
-                    skip_paper = True
+                    continue
                 elif retry_failed == False:
                     print(f"跳过未找到链接的论文 ({i+1}/{total_papers}): {title}")
-                    skip_paper = True
+                    continue
             
-            if skip_paper:
-                continue
+            pending_papers.append((i, paper))
+        
+        # 按共同作者分组，每组只进行一次作者搜索
+        if batch_by_author:
+            author_groups, leftovers = plan_author_queries(pending_papers)
+            print(f"查询计划: {len(author_groups)} 次作者搜索，"
+                  f"覆盖 {len(pending_papers) - len(leftovers)} 篇论文，"
+                  f"{len(leftovers)} 篇论文按标题搜索")
+            
+            for author, members in author_groups:
+                print(f"\n处理作者分组: {author}")
+                titles = [paper.get("title") for _, paper in members]
+                matched = get_author_eprint_urls(author, titles, driver=driver)
+                
+                for i, paper in members:
+                    title = paper.get("title")
+                    if title not in matched:
+                        # 未匹配的论文留待按标题搜索
+                        leftovers.append((i, paper))
+                        continue
+                    result_dict[title] = {
+                        "title": title,
+                        "authors": paper.get("authors", ""),
+                        "eprint_url": matched[title],
+                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                    }
+                
+                save_results(result_dict, output_file)
+                
+                # 延时，避免请求过于频繁
+                delay_time = 1 + (len(members) % 3)
+                print(f"等待 {delay_time} 秒...")
+                time.sleep(delay_time)
+            
+            leftovers.sort(key=lambda p: p[0])
+        else:
+            leftovers = pending_papers
+        
+        # 处理剩余的每篇论文
+        for i, paper in leftovers:
+            title = paper.get("title")
+            authors = paper.get("authors", "")
                 
             print(f"\n处理论文 {i+1}/{total_papers}: {title}")
             
@@ -301,11 +517,7 @@ def process_papers_from_json(use_headless=True, start_index=0, end_index=None, r
             }
             
             # 每处理一篇论文，立即保存结果
-            try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(result_dict, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                print(f"保存结果时出错: {str(e)}")
+            save_results(result_dict, output_file)
             
             # 延时，避免请求过于频繁
             delay_time = 1 + (i % 3)  # 稍微随机化延迟时间，避免规律性请求
@@ -331,6 +543,7 @@ if __name__ == "__main__":
     parser.add_argument('--start', type=int, default=0, help='开始处理的论文索引（从0开始）')
     parser.add_argument('--end', type=int, default=None, help='结束处理的论文索引（不包含）')
     parser.add_argument('--retry-failed', action='store_true', help='重试之前失败的论文')
+    parser.add_argument('--no-author-batch', action='store_true', help='不按共同作者批量搜索，逐篇按标题搜索')
     
     args = parser.parse_args()
     
@@ -338,5 +551,6 @@ if __name__ == "__main__":
         use_headless=not args.no_headless,
         start_index=args.start,
         end_index=args.end,
-        retry_failed=args.retry_failed
+        retry_failed=args.retry_failed,
+        batch_by_author=not args.no_author_batch
     )